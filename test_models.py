@@ -2,9 +2,11 @@
 Tests for the task management models.
 """
 import pytest
-from datetime import datetime, timedelta
+from datetime import timedelta
 
-from models import Task, TaskList, Tag, User, Priority, TaskStatus
+from pydantic import ValidationError
+
+from models import Task, TaskList, Tag, User, Priority, TaskStatus, _utcnow
 
 
 class TestTag:
@@ -35,7 +37,7 @@ class TestTag:
     def test_tag_is_immutable(self):
         """Test that tags are immutable (frozen)."""
         tag = Tag(name="work")
-        with pytest.raises(TypeError):
+        with pytest.raises(ValidationError, match="frozen"):
             tag.name = "personal"
 
 
@@ -53,7 +55,7 @@ class TestTask:
 
     def test_create_full_task(self):
         """Test creating a task with all fields."""
-        due = datetime.utcnow() + timedelta(days=7)
+        due = _utcnow() + timedelta(days=7)
         tag = Tag(name="work")
         task = Task(
             id=1,
@@ -188,8 +190,9 @@ class TestTaskList:
 
     def test_get_overdue_tasks(self):
         """Test getting overdue tasks."""
-        past = datetime.utcnow() - timedelta(days=1)
-        future = datetime.utcnow() + timedelta(days=1)
+        now = _utcnow()
+        past = now - timedelta(days=1)
+        future = now + timedelta(days=1)
         tasks = [
             Task(title="Overdue", due_date=past, status=TaskStatus.TODO),
             Task(title="Not overdue", due_date=future, status=TaskStatus.TODO),
@@ -261,8 +264,8 @@ class TestModelSerialization:
             priority=Priority.HIGH,
             status=TaskStatus.IN_PROGRESS
         )
-        json_str = original.json()
-        restored = Task.parse_raw(json_str)
+        json_str = original.model_dump_json()
+        restored = Task.model_validate_json(json_str)
         assert restored.title == original.title
         assert restored.priority == original.priority
         assert restored.status == original.status
@@ -270,7 +273,7 @@ class TestModelSerialization:
     def test_task_dict_roundtrip(self):
         """Test that a task can be converted to dict and back."""
         original = Task(title="Test Task")
-        d = original.dict()
+        d = original.model_dump()
         restored = Task(**d)
         assert restored.title == original.title
 
@@ -280,5 +283,5 @@ class TestModelSerialization:
         task = Task(title="Test", tags=[tag])
         tl = TaskList(name="My List", owner="john", tasks=[task])
         
-        d = tl.dict()
+        d = tl.model_dump()
         assert d["tasks"][0]["tags"][0]["name"] == "work"